@@ -1,119 +1,663 @@
+import numpy as np
 import pandas as pd
-import heapq  # Importa a biblioteca para a fila de prioridade (min-heap)
+import sys
 import time   # Importa a biblioteca para medir o tempo de execução
+from numba import njit, prange  # Compilação JIT (e paralelização) das rotinas críticas
 
 # --- Constantes ---
 COST_PER_METER = 2.0  # Exemplo: R$ 2,00 por metro de cabo/estrada
+FILTER_KRUSKAL_THRESHOLD = 1000  # Abaixo disso, Filter-Kruskal apenas ordena e varre
 
-# ... (A classe DSU continua exatamente a mesma) ...
-class DSU:
-    """
-    Implementação da estrutura de dados Disjoint Set Union (DSU) ou Union-Find.
-    Utiliza otimizações de compressão de caminho e união por rank para alta eficiência.
-    """
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [1] * n
-
-    def find(self, i):
-        if self.parent[i] == i:
-            return i
-        self.parent[i] = self.find(self.parent[i])
-        return self.parent[i]
-
-    def union(self, x, y):
-        root_x = self.find(x)
-        root_y = self.find(y)
-        if root_x != root_y:
-            if self.rank[root_x] < self.rank[root_y]:
-                self.parent[root_x] = root_y
-            elif self.rank[root_x] > self.rank[root_y]:
-                self.parent[root_y] = root_x
-            else:
-                self.parent[root_y] = root_x
-                self.rank[root_x] += 1
-            return True
+
+@njit(cache=True)
+def dsu_find(parent, i):
+    """
+    Operação find de um DSU representado por um array de pais, com "path halving".
+    """
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+@njit(cache=True)
+def dsu_union(parent, size, x, y):
+    """
+    Operação union de um DSU em arrays, com união por tamanho.
+    Returns:
+        bool: True se x e y estavam em conjuntos diferentes e foram unidos.
+    """
+    root_x = dsu_find(parent, x)
+    root_y = dsu_find(parent, y)
+    if root_x == root_y:
         return False
+    if size[root_x] < size[root_y]:
+        root_x, root_y = root_y, root_x
+    parent[root_y] = root_x
+    size[root_x] += size[root_y]
+    return True
+
+
+@njit(cache=True)
+def kruskal_scan(u_sorted, v_sorted, w_sorted, parent, size, mst_edges, count):
+    """
+    Varre arestas já ordenadas por peso, unindo componentes no DSU (parent, size)
+    e gravando as arestas aceitas em mst_edges a partir da posição count.
+    Returns:
+        int: O novo número de arestas em mst_edges.
+    """
+    n = parent.size
+    for k in range(u_sorted.size):
+        if count == n - 1:
+            break
+        if not dsu_union(parent, size, u_sorted[k], v_sorted[k]):
+            continue
+        mst_edges[count, 0] = u_sorted[k]
+        mst_edges[count, 1] = v_sorted[k]
+        mst_edges[count, 2] = w_sorted[k]
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def filter_edges(parent, u, v):
+    """
+    Retorna uma máscara com as arestas cujos extremos ainda estão em componentes diferentes.
+    """
+    keep = np.empty(u.size, dtype=np.bool_)
+    for k in range(u.size):
+        keep[k] = dsu_find(parent, u[k]) != dsu_find(parent, v[k])
+    return keep
+
+
+@njit(cache=True)
+def mst_total_cost(mst_edges, count):
+    """
+    Soma, em ordem, os pesos das count primeiras arestas de mst_edges.
+    """
+    mst_cost = 0.0
+    for k in range(count):
+        mst_cost += mst_edges[k, 2]
+    return mst_cost
+
+
+@njit(cache=True)
+def kruskal_core(u_sorted, v_sorted, w_sorted, n):
+    """
+    Laço principal de Kruskal compilado com Numba, incluindo um DSU sobre arrays.
+    As arestas já devem estar ordenadas por peso.
+    Args:
+        u_sorted (np.ndarray): Origens (int32) das arestas ordenadas.
+        v_sorted (np.ndarray): Destinos (int32) das arestas ordenadas.
+        w_sorted (np.ndarray): Pesos (float64) das arestas ordenadas.
+        n (int): O número total de vértices no grafo.
+    Returns:
+        tuple: (custo_total_mst, matriz (k, 3) com as arestas da MST)
+    """
+    parent = np.arange(n, dtype=np.int32)
+    size = np.ones(n, dtype=np.int32)
+    mst_edges = np.empty((max(n - 1, 0), 3))
+    count = kruskal_scan(u_sorted, v_sorted, w_sorted, parent, size, mst_edges, 0)
+    return mst_total_cost(mst_edges, count), mst_edges[:count]
+
 
 def kruskals_mst(num_vertices, edge_list):
     """
     Executa o algoritmo de Kruskal para encontrar a Árvore Geradora Mínima (MST).
+    A ordenação é feita uma única vez com NumPy e o laço sobre as arestas roda
+    em código compilado (ver kruskal_core).
+    Args:
+        num_vertices (int): O número total de vértices no grafo.
+        edge_list (np.ndarray): Matriz (E, 3) de arestas, onde cada linha é [u, v, peso].
+    Returns:
+        tuple: (custo_total_mst, arestas_da_mst)
+    """
+    weights = edge_list[:, 2]
+    order = np.argsort(weights, kind="stable")
+    u_sorted = edge_list[order, 0].astype(np.int32)
+    v_sorted = edge_list[order, 1].astype(np.int32)
+    w_sorted = weights[order]
+    return kruskal_core(u_sorted, v_sorted, w_sorted, num_vertices)
+
+
+def filter_kruskal_step(u, v, w, parent, size, mst_edges, count, threshold):
+    """
+    Passo recursivo do Filter-Kruskal: resolve as arestas leves (peso <= pivô)
+    e descarta, antes de recursar, as arestas pesadas que já fechariam ciclo.
+    Returns:
+        int: O novo número de arestas em mst_edges.
+    """
+    if count == parent.size - 1 or u.size == 0:
+        return count
+
+    if u.size >= threshold:
+        middle = w.size // 2
+        pivot = np.partition(w, middle)[middle]
+        light = w <= pivot
+        # Com muitos pesos repetidos o pivô pode não separar nada; cai no caso base
+        if not light.all():
+            count = filter_kruskal_step(
+                u[light], v[light], w[light], parent, size, mst_edges, count, threshold
+            )
+            # A metade leve já completou a árvore: não há por que filtrar a pesada
+            if count == parent.size - 1:
+                return count
+            heavy = ~light
+            u_heavy, v_heavy, w_heavy = u[heavy], v[heavy], w[heavy]
+            keep = filter_edges(parent, u_heavy, v_heavy)
+            return filter_kruskal_step(
+                u_heavy[keep], v_heavy[keep], w_heavy[keep],
+                parent, size, mst_edges, count, threshold
+            )
+
+    order = np.argsort(w, kind="stable")
+    return kruskal_scan(u[order], v[order], w[order], parent, size, mst_edges, count)
+
+
+def filter_kruskal(num_vertices, edge_list, threshold=FILTER_KRUSKAL_THRESHOLD):
+    """
+    Executa o Filter-Kruskal (Osipov, Sanders e Singler) para encontrar a MST.
+    Em vez de ordenar todas as arestas, particiona em torno de um pivô, resolve a
+    metade leve e filtra da metade pesada as arestas internas a um componente.
     Args:
         num_vertices (int): O número total de vértices no grafo.
-        edge_list (list): Uma lista de arestas, onde cada aresta é [u, v, peso].
+        edge_list (np.ndarray): Matriz (E, 3) de arestas, onde cada linha é [u, v, peso].
+        threshold (int): Tamanho abaixo do qual as arestas são simplesmente ordenadas.
     Returns:
         tuple: (custo_total_mst, arestas_da_mst)
     """
-    sorted_edge_list = sorted(edge_list, key=lambda item: item[2])
-    dsu = DSU(num_vertices)
-    mst_cost = 0
-    mst_edges = []
-    for node1, node2, weight in sorted_edge_list:
-        if dsu.union(node1, node2):
-            mst_cost += weight
-            mst_edges.append([node1, node2, weight])
-            if len(mst_edges) == num_vertices - 1:
+    parent = np.arange(num_vertices, dtype=np.int32)
+    size = np.ones(num_vertices, dtype=np.int32)
+    mst_edges = np.empty((max(num_vertices - 1, 0), 3))
+    count = filter_kruskal_step(
+        edge_list[:, 0].astype(np.int32),
+        edge_list[:, 1].astype(np.int32),
+        edge_list[:, 2],
+        parent, size, mst_edges, 0, threshold
+    )
+    return mst_total_cost(mst_edges, count), mst_edges[:count]
+
+
+def build_edge_array(data_df):
+    """
+    Remapeia os IDs dos nós para 0..N-1 e monta a matriz de arestas numa única
+    passada vetorizada: os índices são gravados direto nas colunas da matriz,
+    sem listas ou cópias intermediárias.
+    Args:
+        data_df (pd.DataFrame): Colunas node1_orig, node2_orig e peso.
+    Returns:
+        tuple: (IDs originais ordenados, matriz (E, 3) [u, v, peso], peso total do grafo)
+    """
+    col1 = data_df["node1_orig"].to_numpy()
+    col2 = data_df["node2_orig"].to_numpy()
+    weights = data_df["peso"].to_numpy()
+
+    # IDs únicos e ordenados: a posição de cada ID no array é o seu índice remapeado
+    node_ids = np.unique(np.concatenate([col1, col2]))
+
+    edge_arr = np.empty((weights.size, 3))
+    edge_arr[:, 0] = np.searchsorted(node_ids, col1)
+    edge_arr[:, 1] = np.searchsorted(node_ids, col2)
+    edge_arr[:, 2] = weights
+    return node_ids, edge_arr, weights.sum()
+
+
+def build_csr(num_vertices, edge_list):
+    """
+    Constrói a lista de adjacência do grafo não direcionado em formato CSR
+    (Compressed Sparse Row): os vizinhos de v são indices[indptr[v]:indptr[v + 1]],
+    com os pesos correspondentes em weights.
+    Args:
+        num_vertices (int): O número total de vértices no grafo.
+        edge_list (np.ndarray): Matriz (E, 3) de arestas, onde cada linha é [u, v, peso].
+    Returns:
+        tuple: (indptr int32[n + 1], indices int32[2E], weights float64[2E])
+    """
+    u = edge_list[:, 0].astype(np.int32)
+    v = edge_list[:, 1].astype(np.int32)
+    w = edge_list[:, 2]
+    # Cada aresta aparece nos dois sentidos
+    src = np.concatenate([u, v])
+    dst = np.concatenate([v, u])
+    both_weights = np.concatenate([w, w])
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(num_vertices + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=num_vertices), out=indptr[1:])
+    return indptr, dst[order], both_weights[order]
+
+
+# --- ALGORITMO DE BORŮVKA (paralelo) ---
+@njit(cache=True)
+def edge_precedes(w1, a1, b1, w2, a2, b2):
+    """
+    Ordem total entre arestas: por peso e, em caso de empate, pelos extremos.
+    Garante que componentes diferentes nunca escolham arestas que formem ciclo.
+    """
+    if w1 != w2:
+        return w1 < w2
+    if min(a1, b1) != min(a2, b2):
+        return min(a1, b1) < min(a2, b2)
+    return max(a1, b1) < max(a2, b2)
+
+
+@njit(parallel=True, cache=True)
+def boruvka_round(indptr, indices, weights, comp, cheapest):
+    """
+    Para cada vértice v, em paralelo, grava em cheapest[v] a posição (no CSR) da
+    aresta mais leve que sai de v para outro componente, ou -1 se não houver.
+    """
+    for v in prange(comp.size):
+        best = -1
+        for k in range(indptr[v], indptr[v + 1]):
+            u = indices[k]
+            if comp[u] == comp[v]:
+                continue
+            if best == -1 or edge_precedes(weights[k], v, u, weights[best], v, indices[best]):
+                best = k
+        cheapest[v] = best
+
+
+@njit(cache=True)
+def boruvka_merge(indices, weights, comp, cheapest, parent, size, mst_edges, count):
+    """
+    Reduz os candidatos por vértice à aresta mais leve de cada componente, une os
+    componentes no DSU (parent, size) e atualiza comp com o novo representante.
+    Returns:
+        int: O novo número de arestas em mst_edges.
+    """
+    n = comp.size
+    comp_best = np.full(n, -1, dtype=np.int64)
+    for v in range(n):
+        k = cheapest[v]
+        if k == -1:
+            continue
+        c = comp[v]
+        b = comp_best[c]
+        if b == -1 or edge_precedes(weights[k], v, indices[k],
+                                    weights[cheapest[b]], b, indices[cheapest[b]]):
+            comp_best[c] = v
+
+    for c in range(n):
+        v = comp_best[c]
+        if v == -1:
+            continue
+        k = cheapest[v]
+        u = indices[k]
+        # A mesma aresta pode ter sido escolhida pelos dois componentes
+        if not dsu_union(parent, size, v, u):
+            continue
+        mst_edges[count, 0] = v
+        mst_edges[count, 1] = u
+        mst_edges[count, 2] = weights[k]
+        count += 1
+
+    for v in range(n):
+        comp[v] = dsu_find(parent, v)
+    return count
+
+
+def boruvka_mst(num_vertices, adj_csr):
+    """
+    Executa o algoritmo de Borůvka para encontrar a Árvore Geradora Mínima (MST).
+    A cada rodada, todos os componentes escolhem em paralelo sua aresta de saída
+    mais leve e são contraídos; termina em O(log n) rodadas.
+    Args:
+        num_vertices (int): O número total de vértices no grafo.
+        adj_csr (tuple): Lista de adjacência em CSR (indptr, indices, weights), ver build_csr.
+    Returns:
+        tuple: (custo_total_mst, arestas_da_mst)
+    """
+    indptr, indices, weights = adj_csr
+    comp = np.arange(num_vertices, dtype=np.int32)
+    parent = np.arange(num_vertices, dtype=np.int32)
+    size = np.ones(num_vertices, dtype=np.int32)
+    cheapest = np.empty(num_vertices, dtype=np.int64)
+    mst_edges = np.empty((max(num_vertices - 1, 0), 3))
+    count = 0
+    while count < num_vertices - 1:
+        boruvka_round(indptr, indices, weights, comp, cheapest)
+        new_count = boruvka_merge(indices, weights, comp, cheapest, parent, size, mst_edges, count)
+        # Nenhuma união na rodada: o grafo não é conexo e a floresta está completa
+        if new_count == count:
+            break
+        count = new_count
+    return mst_total_cost(mst_edges, count), mst_edges[:count]
+
+
+# --- Heap binário indexado (um slot por vértice) ---
+@njit(cache=True)
+def heap_sift_up(heap, pos, key, i):
+    """
+    Sobe o vértice em heap[i] até restaurar a propriedade de min-heap sobre key.
+    Mantém pos (vértice -> índice no heap) atualizado a cada troca.
+    """
+    vertex = heap[i]
+    vertex_key = key[vertex]
+    while i > 0:
+        parent_i = (i - 1) // 2
+        parent_vertex = heap[parent_i]
+        if key[parent_vertex] <= vertex_key:
+            break
+        heap[i] = parent_vertex
+        pos[parent_vertex] = i
+        i = parent_i
+    heap[i] = vertex
+    pos[vertex] = i
+
+
+@njit(cache=True)
+def heap_sift_down(heap, size, pos, key, i):
+    """
+    Desce o vértice em heap[i] até restaurar a propriedade de min-heap sobre key,
+    considerando apenas as size primeiras posições do heap.
+    Mantém pos (vértice -> índice no heap) atualizado a cada troca.
+    """
+    vertex = heap[i]
+    vertex_key = key[vertex]
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and key[heap[child + 1]] < key[heap[child]]:
+            child += 1
+        if key[heap[child]] >= vertex_key:
+            break
+        heap[i] = heap[child]
+        pos[heap[i]] = i
+        i = child
+    heap[i] = vertex
+    pos[vertex] = i
+
+
+@njit(cache=True)
+def heap_pop_min(heap, size, pos, key):
+    """
+    Remove o vértice de menor chave do heap.
+    Returns:
+        tuple: (vértice removido, novo tamanho do heap)
+    """
+    top = heap[0]
+    size -= 1
+    if size > 0:
+        heap[0] = heap[size]
+        heap_sift_down(heap, size, pos, key, 0)
+    pos[top] = -1
+    return top, size
+
+
+@njit(cache=True)
+def prim_core(indptr, indices, weights, num_vertices):
+    """
+    Laço principal de Prim compilado com Numba sobre a adjacência em CSR.
+    Returns:
+        tuple: (custo_total_mst, matriz (k, 3) com as arestas da MST)
+    """
+    # key[v]: peso da aresta mais barata conhecida ligando v à árvore
+    # best_parent[v]: extremo dessa aresta já dentro da árvore
+    # pos[v]: índice de v no heap (-1 se fora do heap)
+    key = np.full(num_vertices, np.inf)
+    best_parent = np.full(num_vertices, -1, dtype=np.int32)
+    pos = np.full(num_vertices, -1, dtype=np.int32)
+    heap = np.empty(num_vertices, dtype=np.int32)
+    heap_size = 0
+
+    # Marca os vértices já incluídos na MST (1 byte por vértice)
+    visited = np.zeros(num_vertices, dtype=np.bool_)
+
+    mst_cost = 0.0
+    mst_edges = np.empty((num_vertices - 1, 3))
+    count = 0
+    target = num_vertices - 1  # Uma MST tem exatamente n - 1 arestas
+
+    # Começa o algoritmo a partir do vértice 0 (poderia ser qualquer um)
+    start_vertex = 0
+    key[start_vertex] = 0.0
+    heap[0] = start_vertex
+    pos[start_vertex] = 0
+    heap_size = 1
+
+    # O loop continua até que a MST esteja completa
+    while heap_size > 0 and count < target:
+        v, heap_size = heap_pop_min(heap, heap_size, pos, key)
+        visited[v] = True
+        if best_parent[v] != -1:
+            mst_cost += key[v]
+            mst_edges[count, 0] = best_parent[v]
+            mst_edges[count, 1] = v
+            mst_edges[count, 2] = key[v]
+            count += 1
+            # Última aresta adicionada: não há por que relaxar os vizinhos de v
+            if count == target:
                 break
-    return mst_cost, mst_edges
+
+        # Relaxa as arestas do novo vértice 'v' (decrease-key quando melhora)
+        for k in range(indptr[v], indptr[v + 1]):
+            neighbor = indices[k]
+            weight = weights[k]
+            if not visited[neighbor] and weight < key[neighbor]:
+                key[neighbor] = weight
+                best_parent[neighbor] = v
+                if pos[neighbor] == -1:
+                    pos[neighbor] = heap_size
+                    heap[heap_size] = neighbor
+                    heap_size += 1
+                heap_sift_up(heap, pos, key, pos[neighbor])
+
+    return mst_cost, mst_edges[:count]
+
 
 # --- NOVA FUNÇÃO: ALGORITMO DE PRIM ---
-def prims_mst(num_vertices, adj_list):
+def prims_mst(num_vertices, adj_csr):
     """
     Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima (MST).
-    Utiliza uma fila de prioridade (min-heap) para eficiência.
+    Utiliza um heap binário indexado com decrease-key: cada vértice ocupa no
+    máximo um slot, com chave igual à aresta mais barata que o liga à árvore.
+    O laço roda em código compilado (ver prim_core).
     Args:
         num_vertices (int): O número total de vértices no grafo.
-        adj_list (dict): Uma lista de adjacência do grafo. {vértice: [(vizinho, peso), ...]}
+        adj_csr (tuple): Lista de adjacência em CSR (indptr, indices, weights), ver build_csr.
     Returns:
         tuple: (custo_total_mst, arestas_da_mst)
     """
     if num_vertices == 0:
         return 0, []
 
-    # Fila de prioridade (min-heap) para armazenar as arestas a serem consideradas.
-    # Formato: (peso, vértice_origem, vértice_destino)
-    min_heap = []
-    
-    # Conjunto para rastrear os vértices já incluídos na MST
-    visited = set()
-    
-    mst_cost = 0
-    mst_edges = []
-    
-    # Começa o algoritmo a partir do vértice 0 (poderia ser qualquer um)
+    indptr, indices, weights = adj_csr
+    return prim_core(indptr, indices, weights, num_vertices)
+
+
+# --- Pairing heap em arrays (o "handle" de cada item é o próprio vértice) ---
+@njit(cache=True)
+def pairing_meld(a, b, key, child, sibling, prev):
+    """
+    Une duas raízes de pairing heap; a de maior chave vira o filho mais à esquerda
+    da outra. Retorna a nova raiz (-1 representa um heap vazio).
+    """
+    if a == -1:
+        return b
+    if b == -1:
+        return a
+    if key[b] < key[a]:
+        a, b = b, a
+    sibling[b] = child[a]
+    if child[a] != -1:
+        prev[child[a]] = b
+    prev[b] = a
+    child[a] = b
+    return a
+
+
+@njit(cache=True)
+def pairing_push(root, v, key, child, sibling, prev):
+    """
+    Insere o vértice v (com chave key[v]) no heap em O(1). Retorna a nova raiz.
+    """
+    child[v] = -1
+    sibling[v] = -1
+    prev[v] = -1
+    return pairing_meld(root, v, key, child, sibling, prev)
+
+
+@njit(cache=True)
+def pairing_decrease_key(root, v, new_key, key, child, sibling, prev):
+    """
+    Diminui a chave de v: corta a subárvore de v e a une de volta à raiz.
+    Retorna a nova raiz.
+    """
+    key[v] = new_key
+    if v == root:
+        return root
+    # prev[v] é o pai quando v é o filho mais à esquerda, senão o irmão anterior
+    if child[prev[v]] == v:
+        child[prev[v]] = sibling[v]
+    else:
+        sibling[prev[v]] = sibling[v]
+    if sibling[v] != -1:
+        prev[sibling[v]] = prev[v]
+    sibling[v] = -1
+    prev[v] = -1
+    return pairing_meld(root, v, key, child, sibling, prev)
+
+
+@njit(cache=True)
+def pairing_pop_min(root, key, child, sibling, prev, buffer):
+    """
+    Remove a raiz do heap com o esquema de duas passadas: une os filhos aos pares
+    da esquerda para a direita e depois acumula da direita para a esquerda.
+    Retorna a nova raiz.
+    """
+    pairs = 0
+    c = child[root]
+    child[root] = -1
+    while c != -1:
+        a = c
+        b = sibling[a]
+        c = sibling[b] if b != -1 else -1
+        sibling[a] = -1
+        prev[a] = -1
+        if b != -1:
+            sibling[b] = -1
+            prev[b] = -1
+        buffer[pairs] = pairing_meld(a, b, key, child, sibling, prev)
+        pairs += 1
+    new_root = -1
+    for i in range(pairs - 1, -1, -1):
+        new_root = pairing_meld(new_root, buffer[i], key, child, sibling, prev)
+    return new_root
+
+
+@njit(cache=True)
+def prim_pairing_core(indptr, indices, weights, num_vertices):
+    """
+    Laço de Prim sobre a adjacência em CSR usando um pairing heap com decrease-key.
+    Returns:
+        tuple: (custo_total_mst, matriz (k, 3) com as arestas da MST)
+    """
+    key = np.full(num_vertices, np.inf)
+    best_parent = np.full(num_vertices, -1, dtype=np.int32)
+    child = np.full(num_vertices, -1, dtype=np.int32)
+    sibling = np.full(num_vertices, -1, dtype=np.int32)
+    prev = np.full(num_vertices, -1, dtype=np.int32)
+    buffer = np.empty(num_vertices, dtype=np.int32)
+    in_heap = np.zeros(num_vertices, dtype=np.bool_)
+
+    visited = np.zeros(num_vertices, dtype=np.bool_)
+
+    mst_cost = 0.0
+    mst_edges = np.empty((num_vertices - 1, 3))
+    count = 0
+    target = num_vertices - 1  # Uma MST tem exatamente n - 1 arestas
+
     start_vertex = 0
-    visited.add(start_vertex)
-    
-    # Adiciona todas as arestas do vértice inicial à fila de prioridade
-    for neighbor, weight in adj_list.get(start_vertex, []):
-        heapq.heappush(min_heap, (weight, start_vertex, neighbor))
+    key[start_vertex] = 0.0
+    root = pairing_push(-1, start_vertex, key, child, sibling, prev)
+    in_heap[start_vertex] = True
 
-    # O loop continua até que a MST esteja completa
-    while min_heap and len(visited) < num_vertices:
-        weight, u, v = heapq.heappop(min_heap)
-        
-        # Se o vértice de destino já foi visitado, esta aresta cria um ciclo. Pule.
-        if v not in visited:
-            visited.add(v)
-            mst_cost += weight
-            mst_edges.append([u, v, weight])
-            
-            # Adiciona as arestas do novo vértice 'v' à fila de prioridade
-            for next_neighbor, next_weight in adj_list.get(v, []):
-                if next_neighbor not in visited:
-                    heapq.heappush(min_heap, (next_weight, v, next_neighbor))
-    
-    return mst_cost, mst_edges
+    while root != -1 and count < target:
+        v = root
+        root = pairing_pop_min(root, key, child, sibling, prev, buffer)
+        in_heap[v] = False
+        visited[v] = True
+        if best_parent[v] != -1:
+            mst_cost += key[v]
+            mst_edges[count, 0] = best_parent[v]
+            mst_edges[count, 1] = v
+            mst_edges[count, 2] = key[v]
+            count += 1
+            # Última aresta adicionada: não há por que relaxar os vizinhos de v
+            if count == target:
+                break
 
+        for k in range(indptr[v], indptr[v + 1]):
+            neighbor = indices[k]
+            weight = weights[k]
+            if not visited[neighbor] and weight < key[neighbor]:
+                best_parent[neighbor] = v
+                if in_heap[neighbor]:
+                    root = pairing_decrease_key(root, neighbor, weight, key, child, sibling, prev)
+                else:
+                    key[neighbor] = weight
+                    root = pairing_push(root, neighbor, key, child, sibling, prev)
+                    in_heap[neighbor] = True
 
-def main():
+    return mst_cost, mst_edges[:count]
+
+
+def prims_mst_pairing(num_vertices, adj_csr):
+    """
+    Executa o algoritmo de Prim usando um pairing heap no lugar do heap binário.
+    O pairing heap tem inserção O(1) e decrease-key barato (amortizado), o que
+    favorece grafos com muitas relaxações.
+    Args:
+        num_vertices (int): O número total de vértices no grafo.
+        adj_csr (tuple): Lista de adjacência em CSR (indptr, indices, weights), ver build_csr.
+    Returns:
+        tuple: (custo_total_mst, arestas_da_mst)
+    """
+    if num_vertices == 0:
+        return 0, []
+
+    indptr, indices, weights = adj_csr
+    return prim_pairing_core(indptr, indices, weights, num_vertices)
+
+
+# Algoritmos disponíveis: nome -> (rótulo na tabela, função, usa a adjacência CSR?)
+# As funções que não usam CSR recebem a matriz de arestas (E, 3).
+MST_ALGORITHMS = {
+    "kruskal": ("Algoritmo de Kruskal", kruskals_mst, False),
+    "filter_kruskal": ("Algoritmo Filter-Kruskal", filter_kruskal, False),
+    "prim": ("Algoritmo de Prim", prims_mst, True),
+    "prim_pairing": ("Algoritmo de Prim (pairing heap)", prims_mst_pairing, True),
+    "boruvka": ("Algoritmo de Borůvka", boruvka_mst, True),
+}
+
+
+def main(algorithms=tuple(MST_ALGORITHMS)):
     """
     Função principal que executa o fluxo completo e compara os algoritmos.
+    Args:
+        algorithms (iterable): Nomes (chaves de MST_ALGORITHMS) dos algoritmos a executar.
     """
+    unknown = [name for name in algorithms if name not in MST_ALGORITHMS]
+    if unknown:
+        print(f"Erro: Algoritmo(s) desconhecido(s): {', '.join(unknown)}. "
+              f"Opções: {', '.join(MST_ALGORITHMS)}.")
+        return
+    if not algorithms:
+        print("Erro: Nenhum algoritmo selecionado.")
+        return
+
     # --- 1. Leitura dos dados ---
     try:
-        data_df = pd.read_csv("dados.csv", sep=" ", header=None)
-        data_df.columns = ["node1_orig", "node2_orig", "peso"]
+        # Tipos explícitos: o parser em C já entrega colunas tipadas, sem inferência
+        data_df = pd.read_csv(
+            "dados.csv",
+            sep=" ",
+            header=None,
+            names=["node1_orig", "node2_orig", "peso"],
+            dtype={"node1_orig": np.int32, "node2_orig": np.int32, "peso": np.float64},
+            engine="c",
+        )
     except FileNotFoundError:
         print("Erro: O arquivo 'dados.csv' não foi encontrado.")
         return
@@ -122,70 +666,63 @@ def main():
         return
 
     # --- 2. Processamento de Nós e Arestas ---
-    all_node_ids = set(data_df["node1_orig"]).union(set(data_df["node2_orig"]))
-    if not all_node_ids:
+    node_ids, edge_arr, original_total_weight = build_edge_array(data_df)
+    if node_ids.size == 0:
         print("Erro: Nenhum nó encontrado no arquivo de dados.")
         return
-        
-    num_vertices = len(all_node_ids)
-    map_id_to_idx = {original_id: i for i, original_id in enumerate(all_node_ids)}
-
-    edge_list = []
-    # Criação da lista de adjacência para o algoritmo de Prim
-    adj_list = {i: [] for i in range(num_vertices)}
-    original_total_weight = 0
-
-    for _, row in data_df.iterrows():
-        source_orig, dest_orig, weight = int(row["node1_orig"]), int(row["node2_orig"]), float(row["peso"])
-        
-        remapped_source = map_id_to_idx[source_orig]
-        remapped_dest = map_id_to_idx[dest_orig]
-
-        # Para Kruskal
-        edge_list.append([remapped_source, remapped_dest, weight])
-        
-        # Para Prim (grafo não direcionado)
-        adj_list[remapped_source].append((remapped_dest, weight))
-        adj_list[remapped_dest].append((remapped_source, weight))
-        
-        original_total_weight += weight
-    
-    print(f"Dados carregados: {num_vertices} vértices e {len(edge_list)} arestas.")
+
+    num_vertices = node_ids.size
+
+    # Lista de adjacência em CSR, a partir da mesma matriz de arestas.
+    # Só é construída se algum algoritmo selecionado (Prim, Borůvka) precisar dela.
+    needs_csr = any(MST_ALGORITHMS[name][2] for name in algorithms)
+    adj_csr = build_csr(num_vertices, edge_arr) if needs_csr else None
+
+    print(f"Dados carregados: {num_vertices} vértices e {len(edge_arr)} arestas.")
     
     # --- 3. Execução e Comparação dos Algoritmos ---
     if num_vertices > 0:
-        
-        # --- Executando Kruskal ---
-        start_time = time.time()
-        kruskal_cost, _ = kruskals_mst(num_vertices, edge_list)
-        kruskal_time = time.time() - start_time
-        
-        # --- Executando Prim ---
-        start_time = time.time()
-        prim_cost, _ = prims_mst(num_vertices, adj_list)
-        prim_time = time.time() - start_time
+
+        # Aquece o JIT para que a compilação não entre na medição de tempo
+        # Três pesos distintos: com threshold=0 o pivô deixa uma metade pesada,
+        # então o Filter-Kruskal também compila filter_edges
+        warmup_edges = np.array([[0, 1, 1.0], [1, 2, 2.0], [2, 3, 3.0]])
+        warmup_csr = build_csr(4, warmup_edges) if needs_csr else None
+
+        results = []
+        for name in algorithms:
+            label, mst_function, uses_csr = MST_ALGORITHMS[name]
+            if name == "filter_kruskal":
+                # threshold=0 força a partição mesmo com poucas arestas
+                filter_kruskal(4, warmup_edges, threshold=0)
+            else:
+                mst_function(4, warmup_csr if uses_csr else warmup_edges)
+
+            start_time = time.time()
+            cost, _ = mst_function(num_vertices, adj_csr if uses_csr else edge_arr)
+            results.append((label, cost, time.time() - start_time))
 
         # --- 4. Apresentação dos Resultados ---
         print("\n--- Tabela Comparativa de Resultados ---")
         print("="*40)
         print(f"Custo da Rede Original: {original_total_weight:,.2f} m")
-        print("-"*40)
-        print("Algoritmo de Kruskal:")
-        print(f"  - Custo da MST: {kruskal_cost:,.2f} m")
-        print(f"  - Tempo de Execução: {kruskal_time:.6f} segundos")
-        print("-"*40)
-        print("Algoritmo de Prim:")
-        print(f"  - Custo da MST: {prim_cost:,.2f} m")
-        print(f"  - Tempo de Execução: {prim_time:.6f} segundos")
+        for label, cost, elapsed in results:
+            print("-"*40)
+            print(f"{label}:")
+            print(f"  - Custo da MST: {cost:,.2f} m")
+            print(f"  - Tempo de Execução: {elapsed:.6f} segundos")
         print("="*40)
-        
+
         # Validação cruzada dos resultados
-        if abs(kruskal_cost - prim_cost) < 1e-9: # Usar tolerância para floats
-            print("\n[SUCESSO] Validação: Ambos os algoritmos encontraram o mesmo custo de MST.")
-        else:
-            print("\n[AVISO] Validação: Os custos da MST são diferentes. Verifique as implementações.")
+        mst_cost = results[0][1]
+        if len(results) > 1:
+            # Tolerância relativa: cada algoritmo soma os pesos numa ordem diferente
+            if all(np.isclose(mst_cost, cost, rtol=1e-12, atol=1e-9) for _, cost, _ in results):
+                print("\n[SUCESSO] Validação: Todos os algoritmos encontraram o mesmo custo de MST.")
+            else:
+                print("\n[AVISO] Validação: Os custos da MST são diferentes. Verifique as implementações.")
 
-        cost_saved = original_total_weight - kruskal_cost # Usa um dos custos, já que são iguais
+        cost_saved = original_total_weight - mst_cost # Usa um dos custos, já que são iguais
         percentage_saved = (cost_saved / original_total_weight) * 100 if original_total_weight > 0 else 0
 
         print(f"\nEconomia total com a MST: {cost_saved:,.2f} m ({percentage_saved:.2f}%)")
@@ -195,4 +732,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Uso: python final.py [algoritmo ...]  (sem argumentos, executa todos)
+    main(sys.argv[1:] or tuple(MST_ALGORITHMS))
@@ -1,71 +1,103 @@
+import numpy as np
 import pandas as pd
 import random
-from functools import cmp_to_key
-
-
-# Comparator para ordenar arestas por peso (terceiro elemento da sublista)
-def comparator(a, b):
-    return a[2] - b[2]
+from numba import njit  # Compilação JIT do DSU e do laço de Kruskal
+
+
+# Operações do DSU sobre arrays NumPy, compiladas com Numba
+@njit(cache=True)
+def dsu_find(parent, i):
+    # Encontra o representante (raiz) do conjunto ao qual i pertence
+    # com compressão de caminho iterativa ("path splitting"): todo nó do
+    # caminho passa a apontar para o avô, numa única passada e sem recursão
+    while parent[i] != i:
+        parent[i], i = parent[parent[i]], parent[i]
+    return i
+
+
+@njit(cache=True)
+def dsu_union(parent, size, x, y):
+    # Une os conjuntos que contêm x e y; retorna False se já estavam unidos
+    root_x = dsu_find(parent, x)
+    root_y = dsu_find(parent, y)
+    if root_x == root_y:
+        return False
+    # União por tamanho: o conjunto menor é pendurado no maior
+    if size[root_x] < size[root_y]:
+        root_x, root_y = root_y, root_x
+    parent[root_y] = root_x
+    size[root_x] += size[root_y]
+    return True
+
+
+@njit(cache=True)
+def kruskal_scan(u_sorted, v_sorted, w_sorted, parent, size):
+    # Percorre as arestas já ordenadas por peso, unindo componentes no DSU.
+    # Retorna o custo da MST e o número de arestas aceitas.
+    num_vertices = parent.size
+    mst_cost = 0.0
+    mst_edge_count = 0
+    for k in range(u_sorted.size):
+        # A MST terá num_vertices - 1 arestas se o grafo for conectado
+        if mst_edge_count == num_vertices - 1:
+            break  # MST completa encontrada
+        if dsu_union(parent, size, u_sorted[k], v_sorted[k]):  # Se não formam ciclo
+            mst_cost += w_sorted[k]
+            mst_edge_count += 1
+    return mst_cost, mst_edge_count
 
 
 # Estrutura de Dados Disjoint Set Union (DSU)
 class DSU:
     def __init__(self, n):
-        # Array pai para nós de 0 a n-1
-        self.parent = list(range(n))
-        self.rank = [1] * n  # Usado para otimização de união por rank
+        # Arrays NumPy para nós de 0 a n-1, compartilhados com os kernels
+        # compilados (dsu_find, dsu_union, kruskal_scan)
+        self.parent = np.arange(n, dtype=np.int32)
+        self.size = np.ones(n, dtype=np.int32)  # Usado para otimização de união por tamanho
 
     def find(self, i):
-        # Encontra o representante (raiz) do conjunto ao qual i pertence
-        # com compressão de caminho
-        if self.parent[i] == i:
-            return i
-        self.parent[i] = self.find(self.parent[i])
-        return self.parent[i]
+        return int(dsu_find(self.parent, i))
 
     def union(self, x, y):
-        # Une os conjuntos que contêm x e y
-        root_x = self.find(x)
-        root_y = self.find(y)
-
-        if root_x != root_y:  # Só une se estiverem em conjuntos diferentes
-            # União por rank para manter a árvore DSU mais plana
-            if self.rank[root_x] < self.rank[root_y]:
-                self.parent[root_x] = root_y
-            elif self.rank[root_x] > self.rank[root_y]:
-                self.parent[root_y] = root_x
-            else:
-                self.parent[root_y] = root_x
-                self.rank[root_x] += 1
-            return True  # União realizada
-        return False  # Já estavam no mesmo conjunto
+        return bool(dsu_union(self.parent, self.size, x, y))
+
+    def size_of(self, i):
+        # Número de elementos no conjunto ao qual i pertence
+        return int(self.size[self.find(i)])
+
+
+# Ordem das arestas por peso crescente
+def edge_order(weights):
+    # Pesos todos inteiros e dentro da faixa de int16: o argsort estável
+    # sobre int16 usa radix sort, O(E) em vez de O(E log E)
+    int16 = np.iinfo(np.int16)
+    if (
+        weights.size > 0
+        and np.all(weights == np.floor(weights))
+        and int16.min <= weights.min()
+        and weights.max() <= int16.max
+    ):
+        return np.argsort(weights.astype(np.int16), kind="stable")
+    # Pesos reais: a estabilidade não altera o custo da MST, então usa o
+    # quicksort padrão (mais rápido que o estável para floats)
+    return np.argsort(weights)
 
 
 # Algoritmo de Kruskal para encontrar a MST
 def kruskals_mst(num_total_vertices, edge_list):
-    # Ordena todas as arestas pelo peso em ordem crescente
-    # Usar sorted() cria uma nova lista ordenada, não modifica a original no lugar.
-    # A chave de ordenação lambda item: item[2] é mais idiomática em Python 3
-    # do que cmp_to_key para simples ordenação por um elemento.
-    # Mas cmp_to_key com seu 'comparator' funciona bem.
-    sorted_edge_list = sorted(edge_list, key=cmp_to_key(comparator))
+    # Ordena todas as arestas pelo peso em ordem crescente.
+    # np.argsort ordena em C, sem chamar uma função Python a cada comparação.
+    order = edge_order(edge_list[:, 2])
+    u_sorted = edge_list[order, 0].astype(np.int32)
+    v_sorted = edge_list[order, 1].astype(np.int32)
+    w_sorted = edge_list[order, 2]
 
     # Inicializa DSU para o número total de vértices (espera-se que os IDs dos nós
     # em edge_list já estejam remapeados para 0 até num_total_vertices-1)
     dsu = DSU(num_total_vertices)
 
-    mst_cost = 0
-    mst_edge_count = 0
-
-    for node1, node2, weight in sorted_edge_list:
-        # node1 e node2 devem ser IDs de nós remapeados (0 a num_total_vertices-1)
-        if dsu.find(node1) != dsu.find(node2):  # Se não formam ciclo
-            dsu.union(node1, node2)
-            mst_cost += weight
-            mst_edge_count += 1
-            # A MST terá num_total_vertices - 1 arestas se o grafo for conectado
-            if mst_edge_count == num_total_vertices - 1:
-                break  # MST completa encontrada
+    # O laço sobre as arestas roda em código compilado, sobre os arrays do DSU
+    mst_cost, mst_edge_count = kruskal_scan(u_sorted, v_sorted, w_sorted, dsu.parent, dsu.size)
 
     # Verificação caso o grafo não seja conectado ou num_total_vertices esteja incorreto
     if mst_edge_count < num_total_vertices - 1 and num_total_vertices > 0:
@@ -75,6 +107,7 @@ def kruskals_mst(num_total_vertices, edge_list):
         print(
             "Isso pode indicar que o grafo não é conectado ou o número de vértices está impreciso."
         )
+        print(f"O componente do nó 0 contém {dsu.size_of(0)} vértices.")
 
     return mst_cost
 
@@ -84,9 +117,17 @@ def kruskals_mst(num_total_vertices, edge_list):
 # 1. Lendo os dados do arquivo
 try:
     # Assume que dados.csv tem colunas separadas por espaço e sem cabeçalho.
-    # As colunas representam: node_origem node_destino
-    data_df = pd.read_csv("dados.csv", sep=" ", header=None)
-    data_df.columns = ["node1_orig", "node2_orig", "peso"]  # Nomes para as colunas
+    # As colunas representam: node_origem node_destino peso
+    # Os tipos são informados ao parser em C, evitando a inferência e as
+    # conversões posteriores
+    data_df = pd.read_csv(
+        "dados.csv",
+        sep=" ",
+        header=None,
+        names=["node1_orig", "node2_orig", "peso"],  # Nomes para as colunas
+        dtype={"node1_orig": np.int32, "node2_orig": np.int32, "peso": np.float64},
+        engine="c",
+    )
 except FileNotFoundError:
     print("Erro: O arquivo 'dados.csv' não foi encontrado. Verifique o caminho.")
     exit()
@@ -95,56 +136,41 @@ except Exception as e:
     exit()
 
 # 2. Determinar características dos nós e preparar arestas
-all_node_ids_in_file = set(data_df["node1_orig"].unique()).union(
-    set(data_df["node2_orig"].unique())
-)
+node1_ids = data_df["node1_orig"].to_numpy()
+node2_ids = data_df["node2_orig"].to_numpy()
+
+# IDs únicos e já ordenados (uma única ordenação + deduplicação em C)
+all_node_ids_in_file = np.unique(np.concatenate([node1_ids, node2_ids]))
 
-if not all_node_ids_in_file:
+if all_node_ids_in_file.size == 0:
     print("Erro: Nenhum nó encontrado no arquivo de dados.")
     exit()
 
-min_id_from_file = min(all_node_ids_in_file)
-max_id_from_file = max(all_node_ids_in_file)
-actual_num_distinct_nodes = len(all_node_ids_in_file)  # Número total de nós únicos
+min_id_from_file = all_node_ids_in_file[0]
+max_id_from_file = all_node_ids_in_file[-1]
+actual_num_distinct_nodes = all_node_ids_in_file.size  # Número total de nós únicos
 
 print(f"IDs dos nós no arquivo variam de {min_id_from_file} a {max_id_from_file}.")
 print(f"Número de nós distintos encontrados: {actual_num_distinct_nodes}.")
 
 # Para o DSU e Kruskal, os nós precisam ser 0-indexados (0 a N-1).
-# Se os nós no arquivo são 1-indexados (1 a N), precisamos remapeá-los.
-id_offset = 0
-if min_id_from_file == 1 and max_id_from_file == actual_num_distinct_nodes:
-    print("Detectado: Nós parecem ser 1-indexados (1 a N). Remapeando para 0 a N-1.")
-    id_offset = 1
-elif min_id_from_file == 0 and max_id_from_file == actual_num_distinct_nodes - 1:
+# A posição de cada ID no array ordenado de IDs únicos é o seu índice remapeado,
+# o que cobre também IDs esparsos ou que não começam em 0 ou 1.
+if min_id_from_file == 0 and max_id_from_file == actual_num_distinct_nodes - 1:
     print(
         "Detectado: Nós parecem ser 0-indexados (0 a N-1). Nenhum remapeamento de ID necessário."
     )
 else:
-    # Para outros casos (ex: IDs esparsos ou começando de um número > 1),
-    # uma estratégia de mapeamento mais robusta (usando um dicionário de mapeamento) seria necessária.
-    # Por simplicidade, se não for 0-indexado, tentamos um offset simples.
-    if min_id_from_file != 0:
-        print(
-            f"Aviso: IDs dos nós não são estritamente 0-indexados ou 1-indexados contíguos."
-        )
-        print(f"Tentando remapear subtraindo {min_id_from_file} de cada ID.")
-        id_offset = min_id_from_file
-
-
-kruskal_edges = []
-original_weight = 0
-for _, row in data_df.iterrows():
-    source_orig = int(row["node1_orig"])
-    destination_orig = int(row["node2_orig"])
-    weight = float(row["peso"])  # Peso aleatório atribuído
+    print("Detectado: IDs dos nós não são 0-indexados contíguos. Remapeando para 0 a N-1.")
 
-    # Remapeia IDs se necessário
-    remapped_source = source_orig - id_offset
-    remapped_destination = destination_orig - id_offset
+# Remapeia IDs de forma vetorizada (coluna a coluna) em vez de linha a linha
+remapped_sources = np.searchsorted(all_node_ids_in_file, node1_ids)
+remapped_destinations = np.searchsorted(all_node_ids_in_file, node2_ids)
+weights = data_df["peso"].to_numpy()
 
-    kruskal_edges.append([remapped_source, remapped_destination, weight])
-    original_weight += weight
+# Matriz (E, 3) com [origem, destino, peso]
+kruskal_edges = np.stack([remapped_sources, remapped_destinations, weights], axis=1)
+original_weight = weights.sum()
 
 # 3. Executar o algoritmo de Kruskal
 # O número de vértices para Kruskal é o número total de nós distintos.